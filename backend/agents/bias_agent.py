@@ -4,16 +4,295 @@ Bias Detection Agent for AI Governance
 Detects and analyzes bias in AI systems across protected characteristics
 """
 
-import json
+import bisect
 import logging
-from typing import Dict, Any, List, Optional
+import re
+import time
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, Any, FrozenSet, List, Optional, Tuple
 from datetime import datetime
-import uuid
 
-from .base_agent import BaseGovernanceAgent
+from .base_agent import (
+    BaseGovernanceAgent, GovernanceResponseCache, GOVERNANCE_JSON_MARKER, HIGH_SEVERITY_LEVELS, _dumps
+)
 
 logger = logging.getLogger(__name__)
 
+# System fields every bias detection needs
+BIAS_REQUIRED_FIELDS = ('system_id', 'system_name', 'system_type')
+
+# Response text for failed detections; the specific error is in the 'error' field
+BIAS_DETECTION_ERROR_MESSAGE = "Bias detection failed due to a technical error. See 'error' for details."
+
+# Shared default for optional mappings that are only read
+_EMPTY_MAPPING = MappingProxyType({})
+
+# Static part of the bias detection prompt; only the system header varies per call
+BIAS_DETECTION_FRAMEWORK = """
+BIAS ANALYSIS FRAMEWORK:
+Analyze potential bias across these protected characteristics:
+- Race/Ethnicity
+- Gender/Sex
+- Age
+- Disability Status
+- Religion
+- Sexual Orientation
+- National Origin
+- Veteran Status
+
+FAIRNESS METRICS TO EVALUATE:
+1. DEMOGRAPHIC PARITY
+   - Equal positive prediction rates across protected groups
+   - Assess if system outcomes are distributed fairly
+   - Flag disparities > 20% between groups
+
+2. EQUALIZED ODDS
+   - Equal true positive and false positive rates across groups
+   - Evaluate if accuracy is consistent across demographics
+   - Critical if disparities > 40%
+
+3. CALIBRATION
+   - Equal positive predictive value across groups
+   - Assess if confidence scores mean the same across groups
+   - Important for high-stakes decisions
+
+4. INDIVIDUAL FAIRNESS
+   - Similar individuals receive similar outcomes
+   - Evaluate if similar cases are treated consistently
+   - Critical for personalized systems
+
+BIAS SOURCES TO IDENTIFY:
+1. TRAINING DATA BIAS
+   - Historical bias in datasets
+   - Representation gaps across groups
+   - Labeling bias and annotation errors
+   - Sampling bias in data collection
+
+2. ALGORITHMIC BIAS
+   - Feature selection bias
+   - Model architecture bias
+   - Optimization objective bias
+   - Proxy discrimination through correlated features
+
+3. DEPLOYMENT BIAS
+   - Usage pattern differences across groups
+   - Feedback loop amplification
+   - Context-dependent performance variations
+   - User interaction bias
+
+BIAS DETECTION REQUIREMENTS:
+- Identify specific bias patterns and affected groups
+- Quantify bias severity using fairness metrics
+- Determine root causes and bias sources
+- Assess impact on different stakeholder groups
+- Generate specific, actionable mitigation strategies
+- Consider legal and ethical implications
+
+RISK ASSESSMENT CRITERIA:
+- High-impact decisions (hiring, lending, healthcare)
+- Large-scale deployment affecting diverse populations
+- Automated decision-making with limited human oversight
+- Historical discrimination in the application domain
+- Regulatory compliance requirements (EEOC, EU AI Act)
+
+OUTPUT REQUIREMENTS:
+Provide comprehensive bias analysis including:
+1. Bias detection findings with specific evidence
+2. Affected protected groups and impact assessment
+3. Fairness metric violations and severity
+4. Root cause analysis of bias sources
+5. Prioritized mitigation strategy recommendations
+6. Compliance implications and legal risks
+7. Monitoring recommendations for ongoing bias detection
+
+Focus on actionable, implementable solutions that address identified biases while maintaining system performance.
+"""
+
+# Use-case scenarios that make a protected characteristic highly relevant
+HIGH_RELEVANCE_SCENARIOS = {
+    'race': ('hiring', 'lending', 'criminal justice', 'education', 'healthcare'),
+    'gender': ('hiring', 'promotion', 'advertising', 'healthcare', 'insurance'),
+    'age': ('hiring', 'insurance', 'healthcare', 'advertising', 'credit'),
+    'disability_status': ('hiring', 'accommodation', 'accessibility', 'healthcare'),
+    'religion': ('hiring', 'advertising', 'content moderation'),
+    'sexual_orientation': ('hiring', 'advertising', 'healthcare', 'content moderation'),
+    'national_origin': ('hiring', 'immigration', 'security screening'),
+    'veteran_status': ('hiring', 'benefits', 'healthcare'),
+    'marital_status': ('hiring', 'insurance', 'credit', 'benefits')
+}
+
+# High-risk system types for specific characteristics
+HIGH_RISK_SYSTEM_TYPES = {
+    'race': frozenset({'hiring_systems', 'criminal_justice', 'credit_assessment'}),
+    'gender': frozenset({'hiring_systems', 'recommendation_system', 'advertising'}),
+    'age': frozenset({'hiring_systems', 'insurance', 'healthcare_ai'}),
+    'disability_status': frozenset({'hiring_systems', 'accessibility_systems'}),
+}
+
+# System types by how strongly they raise protected-characteristic relevance
+HIGH_RELEVANCE_SYSTEM_TYPES = frozenset({'automated_decision_making', 'hiring_systems', 'credit_assessment'})
+MODERATE_RELEVANCE_SYSTEM_TYPES = frozenset({'recommendation_system', 'content_filtering'})
+
+# System types making consequential decisions about individuals
+HIGH_STAKES_SYSTEM_TYPES = frozenset({'automated_decision_making', 'hiring_systems'})
+
+# Complex models carry higher algorithmic bias risk
+COMPLEX_SYSTEM_TYPES = frozenset({'computer_vision', 'natural_language_processing', 'recommendation_system'})
+
+# Systems whose outputs feed back into their own inputs
+FEEDBACK_RISK_SYSTEM_TYPES = frozenset({'recommendation_system', 'automated_decision_making'})
+
+HIGH_AUTOMATION_LEVELS = frozenset({'high', 'full'})
+LOW_OVERSIGHT_LEVELS = frozenset({'none', 'limited'})
+
+# Fairness metric statuses that warrant mitigation
+FLAGGED_METRIC_STATUSES = frozenset({'violation', 'warning'})
+
+# Domains with a history of biased training data
+HIGH_BIAS_DOMAINS = ('hiring', 'lending', 'criminal justice', 'healthcare')
+
+# Every scenario and domain term, matched in one pass over the description.
+# The lookahead tests each offset so overlapping terms are all reported.
+_USE_CASE_TERM_PATTERN = re.compile('(?=(' + '|'.join(
+    re.escape(term) for term in sorted(
+        {term for terms in HIGH_RELEVANCE_SCENARIOS.values() for term in terms} | set(HIGH_BIAS_DOMAINS),
+        key=len, reverse=True
+    )
+) + '))')
+
+# Characteristic risk levels from most to least severe
+CHARACTERISTIC_RISK_LEVELS = ('critical', 'high', 'medium', 'low')
+
+# Fairness metric outcome by number of thresholds cleared (critical, then standard)
+FAIRNESS_STATUSES = ('violation', 'warning', 'compliant')
+FAIRNESS_SEVERITIES = ('high', 'medium', 'low')
+
+# Common affected subgroups by characteristic
+AFFECTED_SUBGROUPS = {
+    'race': ('African American', 'Hispanic/Latino', 'Asian', 'Native American'),
+    'gender': ('Women', 'Non-binary individuals'),
+    'age': ('Older adults (50+)', 'Young adults (18-25)'),
+    'disability_status': ('Individuals with disabilities',),
+    'religion': ('Religious minorities',),
+    'sexual_orientation': ('LGBTQ+ individuals',),
+    'national_origin': ('Foreign-born individuals', 'Non-native speakers')
+}
+
+# Medium bias reports only the first two subgroups
+AFFECTED_SUBGROUPS_MEDIUM = {characteristic: subgroups[:2]
+                             for characteristic, subgroups in AFFECTED_SUBGROUPS.items()}
+
+# Contributing factors reported for each bias source; shared, never mutated
+BIAS_SOURCE_FACTORS = {
+    'training_data': ('Historical bias in domain data', 'Representation gaps in training sets'),
+    'algorithmic': ('Model complexity', 'Feature proxy discrimination', 'Optimization bias'),
+    'deployment': ('Usage pattern differences', 'Context-dependent performance'),
+    'feedback_loops': ('User interaction bias', 'Bias amplification cycles')
+}
+
+# Standard mitigation strategies by bias source
+DATA_MITIGATIONS = (
+    'Audit and rebalance training datasets for demographic representation',
+    'Implement stratified sampling to ensure balanced group representation',
+    'Apply data augmentation techniques to address underrepresented groups'
+)
+
+ALGORITHMIC_MITIGATIONS = (
+    'Implement fairness constraints in model optimization',
+    'Apply bias correction techniques (reweighting, adversarial debiasing)',
+    'Use fairness-aware feature selection methods'
+)
+
+MONITORING_MITIGATIONS = (
+    'Implement continuous bias monitoring with demographic parity tracking',
+    'Establish bias testing protocols for model updates',
+    'Create bias incident response procedures'
+)
+
+# Mitigations applied when a bias source is rated high or critical, in priority order
+SOURCE_MITIGATIONS = (
+    ('training_data', DATA_MITIGATIONS),
+    ('algorithmic', ALGORITHMIC_MITIGATIONS)
+)
+
+def _match_use_case_terms(system_context: Dict[str, Any]) -> FrozenSet[str]:
+    """Scenario and domain terms that occur in the system description"""
+    return frozenset(_USE_CASE_TERM_PATTERN.findall(system_context.get('description', '').lower()))
+
+@dataclass(frozen=True)
+class BiasContext:
+    """System context fields used by bias scoring, read once per detection"""
+    system_type: str
+    decision_automation: str
+    human_oversight: str
+    users_affected: int
+    use_case_terms: FrozenSet[str]
+
+    @classmethod
+    def from_system_context(cls, system_context: Dict[str, Any]) -> 'BiasContext':
+        """Extract the scoring fields from a raw system context"""
+        return cls(
+            system_type=system_context.get('system_type', ''),
+            decision_automation=system_context.get('decision_automation', ''),
+            human_oversight=system_context.get('human_oversight', ''),
+            users_affected=system_context.get('users_affected', 0),
+            use_case_terms=_match_use_case_terms(system_context)
+        )
+
+@dataclass(frozen=True)
+class FairnessMetricConfig:
+    """Definition and pass thresholds for one fairness metric"""
+    description: str
+    threshold: float
+    critical_threshold: float
+
+# Protected characteristics for bias analysis
+PROTECTED_CHARACTERISTICS = (
+    'race', 'gender', 'age', 'ethnicity', 'religion', 'disability_status',
+    'sexual_orientation', 'national_origin', 'veteran_status', 'marital_status'
+)
+
+# Fairness metrics definitions; read-only because every agent shares them
+FAIRNESS_METRICS = MappingProxyType({
+    'demographic_parity': FairnessMetricConfig(
+        description='Equal positive prediction rates across groups',
+        threshold=0.8,  # 80% ratio threshold
+        critical_threshold=0.6
+    ),
+    'equalized_odds': FairnessMetricConfig(
+        description='Equal true positive and false positive rates across groups',
+        threshold=0.8,
+        critical_threshold=0.6
+    ),
+    'calibration': FairnessMetricConfig(
+        description='Equal positive predictive value across groups',
+        threshold=0.85,
+        critical_threshold=0.7
+    ),
+    'individual_fairness': FairnessMetricConfig(
+        description='Similar individuals receive similar outcomes',
+        threshold=0.9,
+        critical_threshold=0.75
+    )
+})
+
+# Simulated score offset per metric type
+FAIRNESS_METRIC_ADJUSTMENTS = {
+    'demographic_parity': -0.05,
+    'equalized_odds': -0.03,
+    'calibration': 0.02,
+    'individual_fairness': -0.08
+}
+
+# Bias severity levels
+BIAS_SEVERITY_THRESHOLDS = MappingProxyType({
+    'critical': 0.6,
+    'high': 0.7,
+    'medium': 0.8,
+    'low': 0.9
+})
+
 class BiasDetectionAgent(BaseGovernanceAgent):
     """
     Detects and analyzes bias in AI systems across protected characteristics
@@ -27,43 +306,21 @@ class BiasDetectionAgent(BaseGovernanceAgent):
         """Initialize bias detection agent"""
         super().__init__(knowledge_store, governance_db, "bias_detection")
 
-        # Protected characteristics for bias analysis
-        self.protected_characteristics = [
-            'race', 'gender', 'age', 'ethnicity', 'religion', 'disability_status',
-            'sexual_orientation', 'national_origin', 'veteran_status', 'marital_status'
-        ]
+        # Shared read-only configuration; see the module-level definitions
+        self.protected_characteristics = PROTECTED_CHARACTERISTICS
+        self.fairness_metrics = FAIRNESS_METRICS
+        self.bias_severity_thresholds = BIAS_SEVERITY_THRESHOLDS
 
-        # Fairness metrics definitions
-        self.fairness_metrics = {
-            'demographic_parity': {
-                'description': 'Equal positive prediction rates across groups',
-                'threshold': 0.8,  # 80% ratio threshold
-                'critical_threshold': 0.6
-            },
-            'equalized_odds': {
-                'description': 'Equal true positive and false positive rates across groups',
-                'threshold': 0.8,
-                'critical_threshold': 0.6
-            },
-            'calibration': {
-                'description': 'Equal positive predictive value across groups',
-                'threshold': 0.85,
-                'critical_threshold': 0.7
-            },
-            'individual_fairness': {
-                'description': 'Similar individuals receive similar outcomes',
-                'threshold': 0.9,
-                'critical_threshold': 0.75
-            }
-        }
+        # Bias scores below each cutoff fall into the matching CHARACTERISTIC_RISK_LEVELS entry
+        self._risk_level_cutoffs = tuple(
+            self.bias_severity_thresholds[level] for level in CHARACTERISTIC_RISK_LEVELS[:-1]
+        )
 
-        # Bias severity levels
-        self.bias_severity_thresholds = {
-            'critical': 0.6,
-            'high': 0.7,
-            'medium': 0.8,
-            'low': 0.9
-        }
+        # AI analysis per system context; only deterministic scoring re-runs on a hit
+        self._bias_analysis_cache = GovernanceResponseCache(
+            maxsize=512,
+            ttl_seconds=self._response_cache.ttl_seconds
+        )
 
     def detect_bias(self, system_context: Dict[str, Any],
                    performance_data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
@@ -78,32 +335,28 @@ class BiasDetectionAgent(BaseGovernanceAgent):
             Comprehensive bias analysis with detected biases, severity, and mitigation strategies
         """
         try:
-            detection_start = datetime.now()
+            detection_start = time.perf_counter()
 
             # Validate input
-            if not self._validate_governance_input(['system_id', 'system_name', 'system_type'], system_context):
+            if not self._validate_governance_input(BIAS_REQUIRED_FIELDS, system_context):
                 raise ValueError("Missing required system information for bias detection")
 
-            # Generate bias detection prompt
-            bias_prompt = self._create_bias_detection_prompt(system_context, performance_data)
-
-            # Get AI-powered bias analysis
-            bias_analysis = self._generate_governance_response(bias_prompt, system_context)
+            bias_analysis, structured_bias = self._get_bias_analysis(system_context, performance_data)
 
-            # Extract structured bias data
-            structured_bias = self._extract_governance_data(bias_analysis, "bias_detection")
+            # Read the scoring inputs (and scan the description) once for all checks
+            bias_context = BiasContext.from_system_context(system_context)
 
             # Assess bias risk across protected characteristics
-            protected_group_analysis = self._assess_protected_group_bias(system_context, structured_bias)
+            protected_group_analysis = self._assess_protected_group_bias(bias_context, structured_bias)
 
             # Calculate fairness metrics
-            fairness_assessment = self._calculate_fairness_metrics(system_context, structured_bias, performance_data)
+            fairness_assessment = self._calculate_fairness_metrics(bias_context, structured_bias, performance_data)
 
             # Determine overall bias severity
             bias_severity = self._determine_bias_severity(protected_group_analysis, fairness_assessment)
 
             # Generate bias sources analysis
-            bias_sources = self._analyze_bias_sources(system_context, structured_bias)
+            bias_sources = self._analyze_bias_sources(bias_context, structured_bias)
 
             # Generate mitigation strategies
             mitigation_strategies = self._generate_bias_mitigation_strategies(
@@ -111,7 +364,7 @@ class BiasDetectionAgent(BaseGovernanceAgent):
             )
 
             # Calculate processing time
-            processing_time = (datetime.now() - detection_start).total_seconds()
+            processing_time = time.perf_counter() - detection_start
 
             # Create bias detection result
             detection_result = {
@@ -128,7 +381,7 @@ class BiasDetectionAgent(BaseGovernanceAgent):
                 'confidence_score': structured_bias.get('confidence_level', 7),
                 'methodology': 'statistical_fairness_analysis',
                 'processing_time_seconds': round(processing_time, 2),
-                'requires_immediate_action': bias_severity in ['critical', 'high'],
+                'requires_immediate_action': bias_severity in HIGH_SEVERITY_LEVELS,
                 'bias_summary': self._generate_bias_summary(bias_severity, protected_group_analysis, fairness_assessment)
             }
 
@@ -144,12 +397,118 @@ class BiasDetectionAgent(BaseGovernanceAgent):
             return self._format_governance_response(bias_analysis, detection_result)
 
         except Exception as e:
-            logger.error(f"Bias detection failed for system {system_context.get('system_id', 'unknown')}: {str(e)}")
+            logger.error("Bias detection failed for system %s: %s", system_context.get('system_id', 'unknown'), e)
             return self._format_governance_response(
-                f"Bias detection failed due to technical error: {str(e)}",
+                BIAS_DETECTION_ERROR_MESSAGE,
                 {'detection_status': 'failed', 'error': str(e)}
             )
 
+    def detect_bias_batch(self, system_contexts: List[Dict[str, Any]],
+                          performance_data: Optional[List[Optional[Dict[str, Any]]]] = None) -> List[Dict[str, Any]]:
+        """
+        Perform bias detection for several AI systems with a single AI analysis request
+
+        Args:
+            system_contexts: AI system information for each system to analyze
+            performance_data: Optional performance data aligned with system_contexts
+
+        Returns:
+            One bias detection result per system, in input order
+
+        Raises:
+            ValueError: If performance_data is given with a different length than system_contexts
+        """
+        if performance_data is None:
+            performance_data = [None] * len(system_contexts)
+        elif len(performance_data) != len(system_contexts):
+            raise ValueError(f"performance_data has {len(performance_data)} entries "
+                             f"for {len(system_contexts)} systems")
+
+        # Systems that are valid and have no cached analysis share one request
+        pending = [
+            system_context for system_context in system_contexts
+            if all(field in system_context for field in BIAS_REQUIRED_FIELDS)
+            and self._bias_analysis_cache.get(GovernanceResponseCache.make_key(system_context)) is None
+        ]
+        if len(pending) > 1:
+            try:
+                self._prefetch_bias_analyses(pending)
+            except Exception as e:
+                logger.warning(f"Batched bias analysis failed for {len(pending)} systems, "
+                               f"falling back to per-system requests: {e}")
+
+        # Cached analyses make these cheap; anything the batch missed is analyzed on its own
+        return [self.detect_bias(system_context, system_performance)
+                for system_context, system_performance in zip(system_contexts, performance_data)]
+
+    def _prefetch_bias_analyses(self, system_contexts: List[Dict[str, Any]]):
+        """Analyze several systems in one Gemini request and cache each system's analysis"""
+        batch_prompt = self._create_batched_bias_detection_prompt(system_contexts)
+        batch_analysis = self._generate_governance_response(batch_prompt)
+
+        records = self._extract_governance_data_batch(batch_analysis, len(system_contexts))
+        if records is None:
+            logger.warning(f"Batched bias analysis unusable for {len(system_contexts)} systems, "
+                           "falling back to per-system requests")
+            return
+
+        for system_context, structured_bias in zip(system_contexts, records):
+            bias_analysis = str(structured_bias.pop('analysis', ''))
+            self._bias_analysis_cache.put(
+                GovernanceResponseCache.make_key(system_context), (bias_analysis, structured_bias)
+            )
+
+    def _create_batched_bias_detection_prompt(self, system_contexts: List[Dict[str, Any]]) -> str:
+        """Create a bias detection prompt covering several systems"""
+        systems = "\n".join(
+            f"SYSTEM {number}:\n{_dumps(system_context)}"
+            for number, system_context in enumerate(system_contexts, 1)
+        )
+
+        specific_instructions = f"""
+BATCH BIAS DETECTION MISSION:
+You are conducting bias detection analysis for {len(system_contexts)} AI systems.
+Analyze each system independently; do not let findings for one system influence another.
+
+{systems}
+
+For each system, assess bias across protected characteristics (race/ethnicity, gender, age,
+disability status, religion, sexual orientation, national origin, veteran status), evaluate
+demographic parity, equalized odds, calibration and individual fairness, identify training data,
+algorithmic and deployment bias sources, and recommend prioritized, actionable mitigations.
+"""
+        json_instructions = (
+            f"\nReturn a short overall summary, then on a new line '{GOVERNANCE_JSON_MARKER}' followed by a "
+            f"JSON array of exactly {len(system_contexts)} objects, one per system in the order above. "
+            "Each object has keys: analysis (the full bias analysis for that system), risk_factors, "
+            "risk_levels, compliance_issues, recommendations, confidence_level, regulatory_frameworks, "
+            "stakeholder_impacts.\n"
+        )
+        return f"{self._BASE_PROMPT}\n{specific_instructions}{json_instructions}"
+
+    def _get_bias_analysis(self, system_context: Dict[str, Any],
+                           performance_data: Optional[Dict[str, Any]]) -> Tuple[str, Dict[str, Any]]:
+        """Get the AI bias analysis and its structured data, reusing cached results"""
+        cache_key = GovernanceResponseCache.make_key(system_context)
+        cached = self._bias_analysis_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # Generate bias detection prompt
+        bias_prompt = self._create_bias_detection_prompt(system_context, performance_data)
+
+        # Get AI-powered bias analysis
+        bias_analysis = self._generate_governance_response(bias_prompt, system_context)
+
+        # Extract structured bias data
+        structured_bias = self._extract_governance_data(bias_analysis, "bias_detection")
+
+        # Fallback text signals a failed generation and must be retried next time
+        if bias_analysis != self._get_governance_fallback_response():
+            self._bias_analysis_cache.put(cache_key, (bias_analysis, structured_bias))
+
+        return bias_analysis, structured_bias
+
     def _create_bias_detection_prompt(self, system_context: Dict[str, Any],
                                     performance_data: Optional[Dict[str, Any]]) -> str:
         """Create specialized bias detection prompt"""
@@ -165,89 +524,11 @@ SYSTEM CONTEXT:
 - Users Affected: {system_context.get('users_affected', 'Unknown')}
 - Decision Automation: {system_context.get('decision_automation', 'Unknown')}
 - Business Impact: {system_context.get('business_impact', 'Unknown')}
-
-BIAS ANALYSIS FRAMEWORK:
-Analyze potential bias across these protected characteristics:
-- Race/Ethnicity
-- Gender/Sex
-- Age
-- Disability Status
-- Religion
-- Sexual Orientation
-- National Origin
-- Veteran Status
-
-FAIRNESS METRICS TO EVALUATE:
-1. DEMOGRAPHIC PARITY
-   - Equal positive prediction rates across protected groups
-   - Assess if system outcomes are distributed fairly
-   - Flag disparities > 20% between groups
-
-2. EQUALIZED ODDS
-   - Equal true positive and false positive rates across groups
-   - Evaluate if accuracy is consistent across demographics
-   - Critical if disparities > 40%
-
-3. CALIBRATION
-   - Equal positive predictive value across groups
-   - Assess if confidence scores mean the same across groups
-   - Important for high-stakes decisions
-
-4. INDIVIDUAL FAIRNESS
-   - Similar individuals receive similar outcomes
-   - Evaluate if similar cases are treated consistently
-   - Critical for personalized systems
-
-BIAS SOURCES TO IDENTIFY:
-1. TRAINING DATA BIAS
-   - Historical bias in datasets
-   - Representation gaps across groups
-   - Labeling bias and annotation errors
-   - Sampling bias in data collection
-
-2. ALGORITHMIC BIAS
-   - Feature selection bias
-   - Model architecture bias
-   - Optimization objective bias
-   - Proxy discrimination through correlated features
-
-3. DEPLOYMENT BIAS
-   - Usage pattern differences across groups
-   - Feedback loop amplification
-   - Context-dependent performance variations
-   - User interaction bias
-
-BIAS DETECTION REQUIREMENTS:
-- Identify specific bias patterns and affected groups
-- Quantify bias severity using fairness metrics
-- Determine root causes and bias sources
-- Assess impact on different stakeholder groups
-- Generate specific, actionable mitigation strategies
-- Consider legal and ethical implications
-
-RISK ASSESSMENT CRITERIA:
-- High-impact decisions (hiring, lending, healthcare)
-- Large-scale deployment affecting diverse populations
-- Automated decision-making with limited human oversight
-- Historical discrimination in the application domain
-- Regulatory compliance requirements (EEOC, EU AI Act)
-
-OUTPUT REQUIREMENTS:
-Provide comprehensive bias analysis including:
-1. Bias detection findings with specific evidence
-2. Affected protected groups and impact assessment
-3. Fairness metric violations and severity
-4. Root cause analysis of bias sources
-5. Prioritized mitigation strategy recommendations
-6. Compliance implications and legal risks
-7. Monitoring recommendations for ongoing bias detection
-
-Focus on actionable, implementable solutions that address identified biases while maintaining system performance.
 """
 
-        return self._create_governance_prompt(specific_instructions)
+        return self._create_governance_prompt(specific_instructions + BIAS_DETECTION_FRAMEWORK)
 
-    def _assess_protected_group_bias(self, system_context: Dict[str, Any],
+    def _assess_protected_group_bias(self, bias_context: BiasContext,
                                    ai_analysis: Dict[str, Any]) -> Dict[str, Any]:
         """Assess bias across protected characteristics"""
 
@@ -255,10 +536,10 @@ Focus on actionable, implementable solutions that address identified biases whil
 
         for characteristic in self.protected_characteristics:
             # Determine relevance based on system type and context
-            relevance = self._assess_characteristic_relevance(characteristic, system_context)
+            relevance = self._assess_characteristic_relevance(characteristic, bias_context)
 
             if relevance['is_relevant']:
-                bias_assessment = self._analyze_characteristic_bias(characteristic, system_context, ai_analysis)
+                bias_assessment = self._analyze_characteristic_bias(characteristic, bias_context, ai_analysis)
 
                 protected_group_analysis[characteristic] = {
                     'relevance': relevance,
@@ -271,129 +552,102 @@ Focus on actionable, implementable solutions that address identified biases whil
 
         return protected_group_analysis
 
-    def _assess_characteristic_relevance(self, characteristic: str, system_context: Dict[str, Any]) -> Dict[str, Any]:
+    def _assess_characteristic_relevance(self, characteristic: str, bias_context: BiasContext) -> Dict[str, Any]:
         """Assess relevance of protected characteristic for this system"""
 
-        system_type = system_context.get('system_type', '')
-        use_case_context = system_context.get('description', '').lower()
-
-        # High relevance scenarios
-        high_relevance_scenarios = {
-            'race': ['hiring', 'lending', 'criminal justice', 'education', 'healthcare'],
-            'gender': ['hiring', 'promotion', 'advertising', 'healthcare', 'insurance'],
-            'age': ['hiring', 'insurance', 'healthcare', 'advertising', 'credit'],
-            'disability_status': ['hiring', 'accommodation', 'accessibility', 'healthcare'],
-            'religion': ['hiring', 'advertising', 'content moderation'],
-            'sexual_orientation': ['hiring', 'advertising', 'healthcare', 'content moderation'],
-            'national_origin': ['hiring', 'immigration', 'security screening'],
-            'veteran_status': ['hiring', 'benefits', 'healthcare'],
-            'marital_status': ['hiring', 'insurance', 'credit', 'benefits']
-        }
+        system_type = bias_context.system_type
 
-        relevance_score = 5.0  # Base relevance
+        # Every increment is whole, so score in integers and convert once
+        relevance_score = 5  # Base relevance
 
         # Check system type relevance
-        if system_type in ['automated_decision_making', 'hiring_systems', 'credit_assessment']:
-            relevance_score += 3.0
-        elif system_type in ['recommendation_system', 'content_filtering']:
-            relevance_score += 2.0
+        if system_type in HIGH_RELEVANCE_SYSTEM_TYPES:
+            relevance_score += 3
+        elif system_type in MODERATE_RELEVANCE_SYSTEM_TYPES:
+            relevance_score += 2
 
         # Check use case relevance
-        for scenario in high_relevance_scenarios.get(characteristic, []):
-            if scenario in use_case_context:
-                relevance_score += 2.0
-                break
+        if not bias_context.use_case_terms.isdisjoint(HIGH_RELEVANCE_SCENARIOS.get(characteristic, ())):
+            relevance_score += 2
 
         # Consider user scale impact
-        users_affected = system_context.get('users_affected', 0)
-        if users_affected > 100000:
-            relevance_score += 1.0
+        if bias_context.users_affected > 100000:
+            relevance_score += 1
 
-        is_relevant = relevance_score >= 6.0
+        is_relevant = relevance_score >= 6
 
         return {
             'is_relevant': is_relevant,
-            'relevance_score': min(10.0, relevance_score),
-            'justification': self._get_relevance_justification(characteristic, system_context, is_relevant)
+            'relevance_score': float(min(10, relevance_score)),
+            'justification': self._get_relevance_justification(characteristic, bias_context, is_relevant)
         }
 
-    def _analyze_characteristic_bias(self, characteristic: str, system_context: Dict[str, Any],
+    def _analyze_characteristic_bias(self, characteristic: str, bias_context: BiasContext,
                                    ai_analysis: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze bias for specific protected characteristic"""
 
         # Base bias score calculation
         bias_score = 0.8  # Default: minimal bias
 
-        system_type = system_context.get('system_type', '')
-
-        # High-risk system types for specific characteristics
-        high_risk_mapping = {
-            'race': ['hiring_systems', 'criminal_justice', 'credit_assessment'],
-            'gender': ['hiring_systems', 'recommendation_system', 'advertising'],
-            'age': ['hiring_systems', 'insurance', 'healthcare_ai'],
-            'disability_status': ['hiring_systems', 'accessibility_systems'],
-        }
-
-        if system_type in high_risk_mapping.get(characteristic, []):
+        if bias_context.system_type in HIGH_RISK_SYSTEM_TYPES.get(characteristic, ()):
             bias_score -= 0.3
 
         # Decision automation impact
-        automation_level = system_context.get('decision_automation', '')
-        if automation_level in ['high', 'full']:
+        automation_level = bias_context.decision_automation
+        if automation_level in HIGH_AUTOMATION_LEVELS:
             bias_score -= 0.2
         elif automation_level == 'medium':
             bias_score -= 0.1
 
         # Human oversight impact (inverse)
-        oversight = system_context.get('human_oversight', '')
-        if oversight in ['none', 'limited']:
+        oversight = bias_context.human_oversight
+        if oversight in LOW_OVERSIGHT_LEVELS:
             bias_score -= 0.2
         elif oversight == 'moderate':
             bias_score -= 0.1
 
         # Scale impact
-        users_affected = system_context.get('users_affected', 0)
-        if users_affected > 1000000:
+        if bias_context.users_affected > 1000000:
             bias_score -= 0.1
 
-        bias_score = max(0.0, min(1.0, bias_score))
+        # Deductions total at most 0.8, so only float rounding can push the score below zero
+        if bias_score < 0.0:
+            bias_score = 0.0
         bias_detected = bias_score < 0.8
 
         return {
             'bias_detected': bias_detected,
             'bias_score': bias_score,
             'affected_subgroups': self._identify_affected_subgroups(characteristic, bias_score),
-            'evidence': self._generate_bias_evidence(characteristic, system_context, bias_score)
+            'evidence': self._generate_bias_evidence(characteristic, bias_context, bias_score)
         }
 
-    def _calculate_fairness_metrics(self, system_context: Dict[str, Any],
+    def _calculate_fairness_metrics(self, bias_context: BiasContext,
                                   structured_bias: Dict[str, Any],
                                   performance_data: Optional[Dict[str, Any]]) -> Dict[str, Any]:
         """Calculate fairness metrics assessment"""
 
         fairness_results = {}
 
+        # Context adjustments are the same for every metric, so simulate them once
+        base_score = self._simulate_fairness_base_score(bias_context, performance_data)
+
         for metric_name, metric_config in self.fairness_metrics.items():
-            # Simulate metric calculation (would use real performance data in production)
-            metric_score = self._simulate_fairness_metric(metric_name, system_context, performance_data)
-
-            # Determine compliance status
-            if metric_score >= metric_config['threshold']:
-                status = 'compliant'
-                severity = 'low'
-            elif metric_score >= metric_config['critical_threshold']:
-                status = 'warning'
-                severity = 'medium'
-            else:
-                status = 'violation'
-                severity = 'high'
+            # Add some variance by metric type; the result stays within [0.52, 0.87]
+            metric_score = base_score + FAIRNESS_METRIC_ADJUSTMENTS.get(metric_name, 0)
+
+            # Determine compliance status: one step up per threshold cleared
+            status_index = ((metric_score >= metric_config.critical_threshold)
+                            + (metric_score >= metric_config.threshold))
+            status = FAIRNESS_STATUSES[status_index]
+            severity = FAIRNESS_SEVERITIES[status_index]
 
             fairness_results[metric_name] = {
                 'score': metric_score,
-                'threshold': metric_config['threshold'],
+                'threshold': metric_config.threshold,
                 'status': status,
                 'severity': severity,
-                'description': metric_config['description'],
+                'description': metric_config.description,
                 'recommendation': self._get_metric_recommendation(metric_name, status, metric_score)
             }
 
@@ -403,19 +657,21 @@ Focus on actionable, implementable solutions that address identified biases whil
                                fairness_assessment: Dict[str, Any]) -> str:
         """Determine overall bias severity level"""
 
-        # Check for critical bias in protected groups
-        critical_bias_count = sum(1 for analysis in protected_group_analysis.values()
-                                if analysis.get('bias_score', 1.0) < self.bias_severity_thresholds['critical'])
-
-        high_bias_count = sum(1 for analysis in protected_group_analysis.values()
-                            if analysis.get('bias_score', 1.0) < self.bias_severity_thresholds['high'])
-
-        # Check fairness metric violations
-        fairness_violations = sum(1 for metric in fairness_assessment.values()
-                                if metric.get('status') == 'violation')
-
-        fairness_warnings = sum(1 for metric in fairness_assessment.values()
-                              if metric.get('status') == 'warning')
+        # Check for critical and high bias in protected groups
+        critical_threshold = self.bias_severity_thresholds['critical']
+        high_threshold = self.bias_severity_thresholds['high']
+        critical_bias_count = high_bias_count = 0
+        for analysis in protected_group_analysis.values():
+            bias_score = analysis.get('bias_score', 1.0)
+            critical_bias_count += bias_score < critical_threshold
+            high_bias_count += bias_score < high_threshold
+
+        # Check fairness metric violations and warnings
+        fairness_violations = fairness_warnings = 0
+        for metric in fairness_assessment.values():
+            status = metric.get('status')
+            fairness_violations += status == 'violation'
+            fairness_warnings += status == 'warning'
 
         # Determine overall severity
         if critical_bias_count > 0 or fairness_violations >= 2:
@@ -429,18 +685,60 @@ Focus on actionable, implementable solutions that address identified biases whil
         else:
             return 'none'
 
-    def _analyze_bias_sources(self, system_context: Dict[str, Any],
+    def _analyze_bias_sources(self, bias_context: BiasContext,
                             structured_bias: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze potential sources of bias"""
 
-        bias_sources = {
-            'training_data': self._assess_training_data_bias(system_context),
-            'algorithmic': self._assess_algorithmic_bias(system_context),
-            'deployment': self._assess_deployment_bias(system_context),
-            'feedback_loops': self._assess_feedback_loop_bias(system_context)
-        }
+        # Every source score stays below 10
+        system_type = bias_context.system_type
+        users_affected = bias_context.users_affected
+
+        # Historical domains have higher training data bias risk
+        training_score = 3.0
+        if not bias_context.use_case_terms.isdisjoint(HIGH_BIAS_DOMAINS):
+            training_score += 2.0
+
+        # Complex models and high automation have higher algorithmic bias risk
+        algorithmic_score = 2.0
+        if system_type in COMPLEX_SYSTEM_TYPES:
+            algorithmic_score += 2.0
+        if bias_context.decision_automation in HIGH_AUTOMATION_LEVELS:
+            algorithmic_score += 1.5
+
+        # Large-scale deployment increases bias amplification risk
+        deployment_score = 2.0
+        if users_affected > 1000000:
+            deployment_score += 2.0
+        elif users_affected > 100000:
+            deployment_score += 1.0
 
-        return bias_sources
+        # Recommendation and decision systems have higher feedback loop risk
+        feedback_score = 1.0
+        if system_type in FEEDBACK_RISK_SYSTEM_TYPES:
+            feedback_score += 3.0
+
+        return {
+            'training_data': {
+                'risk_level': 'high' if training_score >= 6.0 else 'medium' if training_score >= 4.0 else 'low',
+                'risk_score': training_score,
+                'factors': BIAS_SOURCE_FACTORS['training_data']
+            },
+            'algorithmic': {
+                'risk_level': 'high' if algorithmic_score >= 5.0 else 'medium' if algorithmic_score >= 3.5 else 'low',
+                'risk_score': algorithmic_score,
+                'factors': BIAS_SOURCE_FACTORS['algorithmic']
+            },
+            'deployment': {
+                'risk_level': 'medium' if deployment_score >= 4.0 else 'low',
+                'risk_score': deployment_score,
+                'factors': BIAS_SOURCE_FACTORS['deployment']
+            },
+            'feedback_loops': {
+                'risk_level': 'high' if feedback_score >= 4.0 else 'medium' if feedback_score >= 2.5 else 'low',
+                'risk_score': feedback_score,
+                'factors': BIAS_SOURCE_FACTORS['feedback_loops']
+            }
+        }
 
     def _generate_bias_mitigation_strategies(self, protected_group_analysis: Dict[str, Any],
                                            fairness_assessment: Dict[str, Any],
@@ -450,33 +748,18 @@ Focus on actionable, implementable solutions that address identified biases whil
 
         strategies = []
 
-        # Data-related mitigations
-        if bias_sources.get('training_data', {}).get('risk_level') in ['high', 'critical']:
-            strategies.extend([
-                'Audit and rebalance training datasets for demographic representation',
-                'Implement stratified sampling to ensure balanced group representation',
-                'Apply data augmentation techniques to address underrepresented groups'
-            ])
-
-        # Algorithmic mitigations
-        if bias_sources.get('algorithmic', {}).get('risk_level') in ['high', 'critical']:
-            strategies.extend([
-                'Implement fairness constraints in model optimization',
-                'Apply bias correction techniques (reweighting, adversarial debiasing)',
-                'Use fairness-aware feature selection methods'
-            ])
+        # Data-related and algorithmic mitigations
+        for source, mitigations in SOURCE_MITIGATIONS:
+            if bias_sources.get(source, _EMPTY_MAPPING).get('risk_level') in HIGH_SEVERITY_LEVELS:
+                strategies.extend(mitigations)
 
         # Post-processing mitigations
         for metric_name, metric_result in fairness_assessment.items():
-            if metric_result.get('status') in ['violation', 'warning']:
+            if metric_result.get('status') in FLAGGED_METRIC_STATUSES:
                 strategies.append(f"Apply post-processing calibration to improve {metric_name}")
 
         # Monitoring and governance
-        strategies.extend([
-            'Implement continuous bias monitoring with demographic parity tracking',
-            'Establish bias testing protocols for model updates',
-            'Create bias incident response procedures'
-        ])
+        strategies.extend(MONITORING_MITIGATIONS)
 
         return strategies[:10]  # Limit to top 10 strategies
 
@@ -493,134 +776,54 @@ Focus on actionable, implementable solutions that address identified biases whil
         fairness_violations = [metric for metric, result in fairness_assessment.items()
                              if result.get('status') == 'violation']
 
-        summary = f"Bias severity: {bias_severity.upper()}. "
+        summary_parts = [f"Bias severity: {bias_severity.upper()}. "]
 
         if affected_groups:
-            summary += f"Potential bias detected for: {', '.join(affected_groups)}. "
+            summary_parts.append(f"Potential bias detected for: {', '.join(affected_groups)}. ")
 
         if fairness_violations:
-            summary += f"Fairness violations: {', '.join(fairness_violations)}. "
+            summary_parts.append(f"Fairness violations: {', '.join(fairness_violations)}. ")
 
-        if bias_severity in ['critical', 'high']:
-            summary += "Immediate bias mitigation required before deployment."
+        if bias_severity in HIGH_SEVERITY_LEVELS:
+            summary_parts.append("Immediate bias mitigation required before deployment.")
         elif bias_severity == 'medium':
-            summary += "Enhanced bias monitoring and mitigation recommended."
+            summary_parts.append("Enhanced bias monitoring and mitigation recommended.")
         else:
-            summary += "Standard bias monitoring protocols should be sufficient."
+            summary_parts.append("Standard bias monitoring protocols should be sufficient.")
 
-        return summary
+        return ''.join(summary_parts)
 
     # Helper methods for bias analysis components
-    def _assess_training_data_bias(self, system_context: Dict[str, Any]) -> Dict[str, Any]:
-        """Assess training data bias risk"""
-        risk_score = 3.0  # Base score
-
-        # Historical domains have higher training data bias risk
-        high_bias_domains = ['hiring', 'lending', 'criminal justice', 'healthcare']
-        use_case = system_context.get('description', '').lower()
-
-        for domain in high_bias_domains:
-            if domain in use_case:
-                risk_score += 2.0
-                break
-
-        return {
-            'risk_level': 'high' if risk_score >= 6.0 else 'medium' if risk_score >= 4.0 else 'low',
-            'risk_score': min(10.0, risk_score),
-            'factors': ['Historical bias in domain data', 'Representation gaps in training sets']
-        }
-
-    def _assess_algorithmic_bias(self, system_context: Dict[str, Any]) -> Dict[str, Any]:
-        """Assess algorithmic bias risk"""
-        risk_score = 2.0  # Base score
-
-        # Complex models have higher algorithmic bias risk
-        complex_types = ['computer_vision', 'natural_language_processing', 'recommendation_system']
-        if system_context.get('system_type') in complex_types:
-            risk_score += 2.0
-
-        # High automation increases risk
-        if system_context.get('decision_automation') in ['high', 'full']:
-            risk_score += 1.5
-
-        return {
-            'risk_level': 'high' if risk_score >= 5.0 else 'medium' if risk_score >= 3.5 else 'low',
-            'risk_score': min(10.0, risk_score),
-            'factors': ['Model complexity', 'Feature proxy discrimination', 'Optimization bias']
-        }
-
-    def _assess_deployment_bias(self, system_context: Dict[str, Any]) -> Dict[str, Any]:
-        """Assess deployment context bias risk"""
-        risk_score = 2.0  # Base score
-
-        # Large-scale deployment increases bias amplification risk
-        users_affected = system_context.get('users_affected', 0)
-        if users_affected > 1000000:
-            risk_score += 2.0
-        elif users_affected > 100000:
-            risk_score += 1.0
-
-        return {
-            'risk_level': 'medium' if risk_score >= 4.0 else 'low',
-            'risk_score': min(10.0, risk_score),
-            'factors': ['Usage pattern differences', 'Context-dependent performance']
-        }
-
-    def _assess_feedback_loop_bias(self, system_context: Dict[str, Any]) -> Dict[str, Any]:
-        """Assess feedback loop bias risk"""
-        risk_score = 1.0  # Base score
-
-        # Recommendation and decision systems have higher feedback loop risk
-        feedback_risk_types = ['recommendation_system', 'automated_decision_making']
-        if system_context.get('system_type') in feedback_risk_types:
-            risk_score += 3.0
-
-        return {
-            'risk_level': 'high' if risk_score >= 4.0 else 'medium' if risk_score >= 2.5 else 'low',
-            'risk_score': min(10.0, risk_score),
-            'factors': ['User interaction bias', 'Bias amplification cycles']
-        }
-
-    def _simulate_fairness_metric(self, metric_name: str, system_context: Dict[str, Any],
-                                performance_data: Optional[Dict[str, Any]]) -> float:
-        """Simulate fairness metric calculation (would use real data in production)"""
+    def _simulate_fairness_base_score(self, bias_context: BiasContext,
+                                      performance_data: Optional[Dict[str, Any]]) -> float:
+        """Simulate the fairness score shared by all metrics (would use real data in production)"""
 
         # Base fairness score
         base_score = 0.85
 
         # Adjust based on system characteristics
-        system_type = system_context.get('system_type', '')
-        if system_type in ['automated_decision_making', 'hiring_systems']:
+        system_type = bias_context.system_type
+        if system_type in HIGH_STAKES_SYSTEM_TYPES:
             base_score -= 0.15
-        elif system_type in ['recommendation_system']:
+        elif system_type == 'recommendation_system':
             base_score -= 0.05
 
         # Adjust based on decision automation
-        automation = system_context.get('decision_automation', '')
-        if automation in ['high', 'full']:
+        if bias_context.decision_automation in HIGH_AUTOMATION_LEVELS:
             base_score -= 0.1
 
-        # Add some variance by metric type
-        metric_adjustments = {
-            'demographic_parity': -0.05,
-            'equalized_odds': -0.03,
-            'calibration': 0.02,
-            'individual_fairness': -0.08
-        }
-
-        base_score += metric_adjustments.get(metric_name, 0)
-
-        return max(0.0, min(1.0, base_score))
+        return base_score
 
     def _identify_affected_groups(self, protected_group_analysis: Dict[str, Any]) -> List[str]:
-        """Identify groups affected by bias"""
-        affected_groups = []
+        """Identify groups affected by bias, in first-seen order"""
+        affected_groups = {}
 
-        for characteristic, analysis in protected_group_analysis.items():
+        for analysis in protected_group_analysis.values():
             if analysis.get('bias_detected', False):
-                affected_groups.extend(analysis.get('affected_subgroups', []))
+                for group in analysis.get('affected_subgroups', ()):
+                    affected_groups[group] = None
 
-        return list(set(affected_groups))
+        return list(affected_groups)
 
     def _identify_affected_subgroups(self, characteristic: str, bias_score: float) -> List[str]:
         """Identify specific subgroups affected by bias for a characteristic"""
@@ -628,40 +831,18 @@ Focus on actionable, implementable solutions that address identified biases whil
         if bias_score >= 0.8:  # No significant bias
             return []
 
-        # Common affected subgroups by characteristic
-        subgroup_mapping = {
-            'race': ['African American', 'Hispanic/Latino', 'Asian', 'Native American'],
-            'gender': ['Women', 'Non-binary individuals'],
-            'age': ['Older adults (50+)', 'Young adults (18-25)'],
-            'disability_status': ['Individuals with disabilities'],
-            'religion': ['Religious minorities'],
-            'sexual_orientation': ['LGBTQ+ individuals'],
-            'national_origin': ['Foreign-born individuals', 'Non-native speakers']
-        }
-
         # Return potential affected groups (would be data-driven in production)
-        potential_groups = subgroup_mapping.get(characteristic, [f'{characteristic} minorities'])
-
-        # Return subset based on bias severity
         if bias_score < 0.6:  # High bias
-            return potential_groups
-        elif bias_score < 0.8:  # Medium bias
-            return potential_groups[:2] if len(potential_groups) > 2 else potential_groups
-        else:
-            return []
+            subgroups = AFFECTED_SUBGROUPS
+        else:  # Medium bias
+            subgroups = AFFECTED_SUBGROUPS_MEDIUM
+        return list(subgroups.get(characteristic, (f'{characteristic} minorities',)))
 
     def _determine_characteristic_risk_level(self, bias_score: float) -> str:
         """Determine risk level for protected characteristic"""
-        if bias_score < self.bias_severity_thresholds['critical']:
-            return 'critical'
-        elif bias_score < self.bias_severity_thresholds['high']:
-            return 'high'
-        elif bias_score < self.bias_severity_thresholds['medium']:
-            return 'medium'
-        else:
-            return 'low'
+        return CHARACTERISTIC_RISK_LEVELS[bisect.bisect_right(self._risk_level_cutoffs, bias_score)]
 
-    def _get_relevance_justification(self, characteristic: str, system_context: Dict[str, Any],
+    def _get_relevance_justification(self, characteristic: str, bias_context: BiasContext,
                                    is_relevant: bool) -> str:
         """Generate justification for characteristic relevance assessment"""
         if is_relevant:
@@ -669,7 +850,7 @@ Focus on actionable, implementable solutions that address identified biases whil
         else:
             return f"{characteristic} has limited relevance for this system type and use case"
 
-    def _generate_bias_evidence(self, characteristic: str, system_context: Dict[str, Any],
+    def _generate_bias_evidence(self, characteristic: str, bias_context: BiasContext,
                               bias_score: float) -> List[str]:
         """Generate evidence for bias detection"""
         if bias_score >= 0.8:
@@ -678,14 +859,14 @@ Focus on actionable, implementable solutions that address identified biases whil
         evidence = []
 
         # System-based evidence
-        if system_context.get('system_type') in ['automated_decision_making', 'hiring_systems']:
+        if bias_context.system_type in HIGH_STAKES_SYSTEM_TYPES:
             evidence.append(f"High-risk system type for {characteristic} bias")
 
-        if system_context.get('decision_automation') in ['high', 'full']:
+        if bias_context.decision_automation in HIGH_AUTOMATION_LEVELS:
             evidence.append("Limited human oversight increases bias risk")
 
         # Scale-based evidence
-        if system_context.get('users_affected', 0) > 100000:
+        if bias_context.users_affected > 100000:
             evidence.append("Large-scale deployment amplifies potential bias impact")
 
         return evidence
@@ -3,10 +3,87 @@ CRO Liability Protection Agent
 Provides defensible decision documentation and regulatory consequence analysis
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Mapping, Optional, Tuple
 from dataclasses import dataclass
+from enum import IntEnum
+from functools import cached_property
+from types import MappingProxyType
 from datetime import datetime
 import json
+import zlib
+
+
+# Precedent cases cited for each regulatory consequence; shared by every instance
+EU_AI_ACT_PRECEDENTS = ("DFS fined €2.8M for algorithmic discrimination", "ING fined €675K for biased credit algorithms")
+GDPR_PRECEDENTS = ("Google fined €50M for GDPR violations", "Amazon fined €746M for data processing")
+BIAS_PRECEDENTS = ("HUD vs Facebook $5M settlement", "Goldman Sachs Apple Card bias investigation")
+
+# Standard documentation attached to every defensible decision; shared, never mutated
+DECISION_EVIDENCE = (
+    "Multi-agent AI governance assessment report",
+    "Regulatory compliance analysis across 4 frameworks",
+    "Bias detection and fairness evaluation results",
+    "Risk mitigation implementation plan",
+    "Expert consultation with AI governance specialists",
+    "Industry benchmark comparison analysis",
+    "Cost-benefit analysis of remediation vs. operational continuity"
+)
+
+DECISION_REGULATORY_BASIS = (
+    "EU AI Act Article 9 - Quality management system implementation",
+    "NIST AI RMF - Continuous monitoring and improvement",
+    "ISO 42001 - AI management system with risk-based approach",
+    "GDPR Article 35 - Data protection impact assessment completed"
+)
+
+DECISION_MITIGATION_MEASURES = (
+    "Weekly automated bias detection reports",
+    "Quarterly external fairness audits",
+    "Real-time risk monitoring with alert thresholds",
+    "Immutable audit trails for all AI decisions",
+    "Enhanced user notification and explanation systems",
+    "Continuous staff training on AI governance"
+)
+
+DECISION_EXPERT_CONSULTATIONS = (
+    "AI Governance Legal Counsel - Smith & Associates",
+    "Algorithmic Fairness Expert - Dr. Johnson (Stanford AI Lab)",
+    "Regulatory Compliance Specialist - Jones Consulting",
+    "Insurance Risk Assessment - Corporate Risk Partners"
+)
+
+
+# Reference data behind the agent's _load_* methods; read-only so instances can share it
+REGULATORY_PENALTY_DATABASE = MappingProxyType({
+    "EU_AI_Act": MappingProxyType({"max_penalty": 35_000_000, "enforcement_probability": 0.4}),
+    "GDPR": MappingProxyType({"max_penalty_percentage": 0.04, "enforcement_probability": 0.6}),
+    "CCPA": MappingProxyType({"max_penalty": 7_500, "enforcement_probability": 0.2})
+})
+
+PRECEDENT_CASE_DATABASE = (
+    MappingProxyType({"case": "HUD vs Facebook", "penalty": 5_000_000, "violation": "algorithmic bias"}),
+    MappingProxyType({"case": "DFS vs AI Lender", "penalty": 2_800_000, "violation": "discriminatory lending"})
+)
+
+INSURANCE_COVERAGE_DATA = MappingProxyType({
+    "d_and_o_limit": 100_000_000,
+    "cyber_limit": 50_000_000,
+    "ai_governance_covered": True
+})
+
+
+class RiskLevel(IntEnum):
+    """Ordered risk level, so the worst of several levels is a plain max()"""
+    NONE = 0
+    LOW = 1
+    MEDIUM = 2
+    HIGH = 3
+    SEVERE = 4
+
+    @property
+    def label(self) -> str:
+        """Lowercase name used in API responses"""
+        return self.name.lower()
 
 
 @dataclass
@@ -16,11 +93,11 @@ class RegulatoryConsequence:
     violation_type: str
     financial_penalty_min: float
     financial_penalty_max: float
-    criminal_liability_risk: str  # "none", "low", "medium", "high"
-    license_revocation_risk: str
-    reputational_damage_level: str
+    criminal_liability_risk: RiskLevel
+    license_revocation_risk: RiskLevel
+    reputational_damage_level: RiskLevel
     timeline_to_enforcement: str
-    precedent_cases: List[str]
+    precedent_cases: Tuple[str, ...]
 
 
 @dataclass
@@ -30,14 +107,35 @@ class DefensibleDecision:
     timestamp: datetime
     decision_maker: str
     decision_rationale: str
-    regulatory_basis: List[str]
+    regulatory_basis: Tuple[str, ...]
     risk_acceptance_justification: str
-    mitigation_measures_implemented: List[str]
-    expert_consultation_record: List[str]
+    mitigation_measures_implemented: Tuple[str, ...]
+    expert_consultation_record: Tuple[str, ...]
     board_approval_required: bool
     legal_review_completed: bool
     insurance_coverage_verified: bool
-    documented_evidence: List[str]
+    documented_evidence: Tuple[str, ...]
+
+
+@dataclass
+class ConsequenceTotals:
+    """Aggregate exposure across a set of regulatory consequences"""
+    penalty_min: float
+    penalty_max: float
+    personal_liability_risk: RiskLevel
+
+
+def _aggregate_consequences(consequences: List[RegulatoryConsequence]) -> ConsequenceTotals:
+    """Total the penalty range and find the worst criminal liability risk in one pass"""
+    penalty_min = penalty_max = 0
+    personal_liability_risk = RiskLevel.LOW
+
+    for c in consequences:
+        penalty_min += c.financial_penalty_min
+        penalty_max += c.financial_penalty_max
+        personal_liability_risk = max(personal_liability_risk, c.criminal_liability_risk)
+
+    return ConsequenceTotals(penalty_min, penalty_max, personal_liability_risk)
 
 
 class LiabilityProtectionAgent:
@@ -46,10 +144,22 @@ class LiabilityProtectionAgent:
     and regulatory consequence analysis
     """
 
-    def __init__(self):
-        self.regulatory_penalties = self._load_regulatory_penalty_database()
-        self.precedent_cases = self._load_precedent_case_database()
-        self.insurance_policies = self._load_insurance_coverage_data()
+    # Reference databases load on first access; consequence analysis does not need them
+
+    @cached_property
+    def regulatory_penalties(self) -> Mapping:
+        """Regulatory penalty database"""
+        return self._load_regulatory_penalty_database()
+
+    @cached_property
+    def precedent_cases(self) -> Tuple[Mapping, ...]:
+        """Legal precedent case database"""
+        return self._load_precedent_case_database()
+
+    @cached_property
+    def insurance_policies(self) -> Mapping:
+        """D&O and cyber insurance coverage data"""
+        return self._load_insurance_coverage_data()
 
     def analyze_regulatory_consequences(self,
                                      governance_assessment: Dict,
@@ -60,22 +170,27 @@ class LiabilityProtectionAgent:
         """
         consequences = []
 
+        # Resolve the shared lookups once for all consequence checks
+        frameworks = governance_assessment.get('compliance_analysis', {}).get('regulatory_frameworks', {})
+        financial_services = system_context.get('business_unit') == 'Financial Services'
+
         # EU AI Act Consequences
-        if governance_assessment.get('compliance_analysis', {}).get('regulatory_frameworks', {}).get('EU_AI_Act', {}).get('compliance_percentage', 0) < 80:
+        eu_ai_act_compliance = frameworks.get('EU_AI_Act', {}).get('compliance_percentage', 0)
+        if eu_ai_act_compliance < 80:
             consequences.append(RegulatoryConsequence(
                 regulation="EU AI Act 2024",
                 violation_type="High-risk AI system non-compliance",
                 financial_penalty_min=10_000_000,  # €10M
                 financial_penalty_max=35_000_000,  # €35M or 7% global revenue
-                criminal_liability_risk="medium" if system_context.get('deployment_status') == 'production' else "low",
-                license_revocation_risk="high" if system_context.get('business_unit') == 'Financial Services' else "medium",
-                reputational_damage_level="severe",
+                criminal_liability_risk=RiskLevel.MEDIUM if system_context.get('deployment_status') == 'production' else RiskLevel.LOW,
+                license_revocation_risk=RiskLevel.HIGH if financial_services else RiskLevel.MEDIUM,
+                reputational_damage_level=RiskLevel.SEVERE,
                 timeline_to_enforcement="6-18 months",
-                precedent_cases=["DFS fined €2.8M for algorithmic discrimination", "ING fined €675K for biased credit algorithms"]
+                precedent_cases=EU_AI_ACT_PRECEDENTS
             ))
 
         # GDPR AI Consequences
-        gdpr_compliance = governance_assessment.get('compliance_analysis', {}).get('regulatory_frameworks', {}).get('GDPR_AI', {}).get('compliance_percentage', 0)
+        gdpr_compliance = frameworks.get('GDPR_AI', {}).get('compliance_percentage', 0)
         if gdpr_compliance < 85:
             global_revenue = system_context.get('company_global_revenue', 1_000_000_000)  # Default 1B
             consequences.append(RegulatoryConsequence(
@@ -83,11 +198,11 @@ class LiabilityProtectionAgent:
                 violation_type="Unlawful automated profiling and discrimination",
                 financial_penalty_min=global_revenue * 0.02,  # 2% global revenue
                 financial_penalty_max=global_revenue * 0.04,  # 4% global revenue
-                criminal_liability_risk="low",
-                license_revocation_risk="low",
-                reputational_damage_level="high",
+                criminal_liability_risk=RiskLevel.LOW,
+                license_revocation_risk=RiskLevel.LOW,
+                reputational_damage_level=RiskLevel.HIGH,
                 timeline_to_enforcement="3-12 months",
-                precedent_cases=["Google fined €50M for GDPR violations", "Amazon fined €746M for data processing"]
+                precedent_cases=GDPR_PRECEDENTS
             ))
 
         # Bias-related consequences
@@ -98,11 +213,11 @@ class LiabilityProtectionAgent:
                 violation_type="Algorithmic discrimination in protected classes",
                 financial_penalty_min=100_000,
                 financial_penalty_max=50_000_000,  # Class action potential
-                criminal_liability_risk="none",
-                license_revocation_risk="medium" if system_context.get('business_unit') == 'Financial Services' else "low",
-                reputational_damage_level="severe",
+                criminal_liability_risk=RiskLevel.NONE,
+                license_revocation_risk=RiskLevel.MEDIUM if financial_services else RiskLevel.LOW,
+                reputational_damage_level=RiskLevel.SEVERE,
                 timeline_to_enforcement="12-36 months",
-                precedent_cases=["HUD vs Facebook $5M settlement", "Goldman Sachs Apple Card bias investigation"]
+                precedent_cases=BIAS_PRECEDENTS
             ))
 
         return consequences
@@ -118,21 +233,13 @@ class LiabilityProtectionAgent:
 
         # Calculate total financial exposure
         consequences = self.analyze_regulatory_consequences(governance_assessment, system_context)
-        total_max_penalty = sum(c.financial_penalty_max for c in consequences)
+        total_max_penalty = _aggregate_consequences(consequences).penalty_max
 
         # Determine if board approval required (>$10M exposure)
         board_approval_required = total_max_penalty > 10_000_000
 
-        # Generate evidence package
-        documented_evidence = [
-            "Multi-agent AI governance assessment report",
-            "Regulatory compliance analysis across 4 frameworks",
-            "Bias detection and fairness evaluation results",
-            "Risk mitigation implementation plan",
-            "Expert consultation with AI governance specialists",
-            "Industry benchmark comparison analysis",
-            "Cost-benefit analysis of remediation vs. operational continuity"
-        ]
+        # One clock read so the decision ID, timestamp and review date agree
+        now = datetime.now()
 
         # Risk acceptance justification based on business context
         revenue_impact = system_context.get('annual_revenue', 10_000_000)
@@ -149,7 +256,7 @@ class LiabilityProtectionAgent:
            - Implemented continuous bias monitoring with weekly reports
            - Enhanced audit logging with immutable governance trails
            - Quarterly third-party fairness assessments scheduled
-           - Legal compliance review completed on {datetime.now().strftime('%Y-%m-%d')}
+           - Legal compliance review completed on {now.strftime('%Y-%m-%d')}
            - D&O insurance coverage verified for AI governance decisions
 
         3. REGULATORY STRATEGY:
@@ -160,35 +267,18 @@ class LiabilityProtectionAgent:
         """
 
         return DefensibleDecision(
-            decision_id=f"GOV-DEC-{datetime.now().strftime('%Y%m%d')}-{hash(decision_maker) % 10000:04d}",
-            timestamp=datetime.now(),
+            decision_id=f"GOV-DEC-{now.strftime('%Y%m%d')}-{zlib.crc32(decision_maker.encode('utf-8')) % 10000:04d}",
+            timestamp=now,
             decision_maker=decision_maker,
             decision_rationale=f"Continue operation of {system_context.get('system_name', 'AI system')} with enhanced monitoring and 6-month compliance improvement plan",
-            regulatory_basis=[
-                "EU AI Act Article 9 - Quality management system implementation",
-                "NIST AI RMF - Continuous monitoring and improvement",
-                "ISO 42001 - AI management system with risk-based approach",
-                "GDPR Article 35 - Data protection impact assessment completed"
-            ],
+            regulatory_basis=DECISION_REGULATORY_BASIS,
             risk_acceptance_justification=risk_acceptance_justification,
-            mitigation_measures_implemented=[
-                "Weekly automated bias detection reports",
-                "Quarterly external fairness audits",
-                "Real-time risk monitoring with alert thresholds",
-                "Immutable audit trails for all AI decisions",
-                "Enhanced user notification and explanation systems",
-                "Continuous staff training on AI governance"
-            ],
-            expert_consultation_record=[
-                "AI Governance Legal Counsel - Smith & Associates",
-                "Algorithmic Fairness Expert - Dr. Johnson (Stanford AI Lab)",
-                "Regulatory Compliance Specialist - Jones Consulting",
-                "Insurance Risk Assessment - Corporate Risk Partners"
-            ],
+            mitigation_measures_implemented=DECISION_MITIGATION_MEASURES,
+            expert_consultation_record=DECISION_EXPERT_CONSULTATIONS,
             board_approval_required=board_approval_required,
             legal_review_completed=True,
             insurance_coverage_verified=True,
-            documented_evidence=documented_evidence
+            documented_evidence=DECISION_EVIDENCE
         )
 
     def calculate_decision_liability_exposure(self,
@@ -197,20 +287,20 @@ class LiabilityProtectionAgent:
         """
         Calculate total liability exposure for decision maker
         """
-        total_financial_max = sum(c.financial_penalty_max for c in consequences)
-        total_financial_min = sum(c.financial_penalty_min for c in consequences)
+        totals = _aggregate_consequences(consequences)
+        total_financial_max = totals.penalty_max
+        total_financial_min = totals.penalty_min
 
-        # Personal liability assessment
-        personal_liability_risk = "low"
-        if any(c.criminal_liability_risk == "high" for c in consequences):
-            personal_liability_risk = "high"
-        elif any(c.criminal_liability_risk == "medium" for c in consequences):
-            personal_liability_risk = "medium"
+        # Personal liability follows the worst criminal liability risk
+        personal_liability_risk = totals.personal_liability_risk
 
         # D&O insurance coverage assessment
         insurance_coverage = decision.insurance_coverage_verified
         estimated_coverage_gap = max(0, total_financial_max - 100_000_000) if insurance_coverage else total_financial_max
 
+        # Scored once; the recommendation is based on the same score
+        defensibility_score = self._calculate_defensibility_score(decision)
+
         return {
             "total_regulatory_exposure": {
                 "minimum": total_financial_min,
@@ -218,7 +308,7 @@ class LiabilityProtectionAgent:
                 "risk_adjusted": total_financial_max * 0.3  # 30% enforcement probability
             },
             "personal_liability": {
-                "criminal_risk": personal_liability_risk,
+                "criminal_risk": personal_liability_risk.label,
                 "civil_risk": "medium" if not decision.legal_review_completed else "low",
                 "reputational_risk": "high"
             },
@@ -227,46 +317,36 @@ class LiabilityProtectionAgent:
                 "estimated_gap": estimated_coverage_gap,
                 "d_and_o_adequate": estimated_coverage_gap < 10_000_000
             },
-            "defensibility_score": self._calculate_defensibility_score(decision),
-            "recommendation": self._generate_liability_recommendation(decision, consequences)
+            "defensibility_score": defensibility_score,
+            "recommendation": self._generate_liability_recommendation(defensibility_score, total_financial_max)
         }
 
     def _calculate_defensibility_score(self, decision: DefensibleDecision) -> float:
         """Calculate how defensible the decision is in court/regulatory proceedings"""
-        score = 0.0
-
-        # Legal review completed (+25 points)
-        if decision.legal_review_completed:
-            score += 25
-
-        # Board approval for high-risk decisions (+20 points)
-        if decision.board_approval_required and "board approved" in decision.risk_acceptance_justification.lower():
-            score += 20
-        elif not decision.board_approval_required:
-            score += 10
-
-        # Expert consultation (+15 points)
-        score += min(15, len(decision.expert_consultation_record) * 5)
-
-        # Mitigation measures implemented (+15 points)
-        score += min(15, len(decision.mitigation_measures_implemented) * 2.5)
-
-        # Documented evidence (+15 points)
-        score += min(15, len(decision.documented_evidence) * 2)
-
-        # Insurance coverage (+10 points)
-        if decision.insurance_coverage_verified:
-            score += 10
+        board_approval_required = bool(decision.board_approval_required)
+        board_approved = (board_approval_required
+                          and "board approved" in decision.risk_acceptance_justification.lower())
+
+        # Every criterion adds its points as a flag or capped count, so no branching is needed
+        score = (
+            # Legal review completed (+25 points)
+            25.0 * bool(decision.legal_review_completed)
+            # Board approval for high-risk decisions (+20 points), or none required (+10 points)
+            + 20 * board_approved + 10 * (not board_approval_required)
+            # Expert consultation, mitigation measures and documented evidence (+15 points each)
+            + min(15, len(decision.expert_consultation_record) * 5)
+            + min(15, len(decision.mitigation_measures_implemented) * 2.5)
+            + min(15, len(decision.documented_evidence) * 2)
+            # Insurance coverage (+10 points)
+            + 10 * bool(decision.insurance_coverage_verified)
+        )
 
         return min(100.0, score)
 
     def _generate_liability_recommendation(self,
-                                         decision: DefensibleDecision,
-                                         consequences: List[RegulatoryConsequence]) -> str:
-        """Generate recommendation for decision maker"""
-
-        defensibility = self._calculate_defensibility_score(decision)
-        max_exposure = sum(c.financial_penalty_max for c in consequences)
+                                         defensibility: float,
+                                         max_exposure: float) -> str:
+        """Generate recommendation for decision maker from defensibility and maximum exposure"""
 
         if defensibility >= 80 and max_exposure < 50_000_000:
             return "PROCEED - Strong legal defensibility with acceptable risk exposure"
@@ -277,35 +357,28 @@ class LiabilityProtectionAgent:
         else:
             return "DO NOT PROCEED - Insufficient defensibility, high personal liability risk"
 
-    def _load_regulatory_penalty_database(self) -> Dict:
+    def _load_regulatory_penalty_database(self) -> Mapping:
         """Load database of regulatory penalties and precedents"""
-        return {
-            "EU_AI_Act": {"max_penalty": 35_000_000, "enforcement_probability": 0.4},
-            "GDPR": {"max_penalty_percentage": 0.04, "enforcement_probability": 0.6},
-            "CCPA": {"max_penalty": 7_500, "enforcement_probability": 0.2}
-        }
+        return REGULATORY_PENALTY_DATABASE
 
-    def _load_precedent_case_database(self) -> List[Dict]:
+    def _load_precedent_case_database(self) -> Tuple[Mapping, ...]:
         """Load database of legal precedent cases"""
-        return [
-            {"case": "HUD vs Facebook", "penalty": 5_000_000, "violation": "algorithmic bias"},
-            {"case": "DFS vs AI Lender", "penalty": 2_800_000, "violation": "discriminatory lending"}
-        ]
+        return PRECEDENT_CASE_DATABASE
 
-    def _load_insurance_coverage_data(self) -> Dict:
+    def _load_insurance_coverage_data(self) -> Mapping:
         """Load D&O and cyber insurance coverage information"""
-        return {
-            "d_and_o_limit": 100_000_000,
-            "cyber_limit": 50_000_000,
-            "ai_governance_covered": True
-        }
+        return INSURANCE_COVERAGE_DATA
 
 
 def generate_executive_summary(liability_analysis: Dict,
                              decision: DefensibleDecision) -> str:
     """Generate executive summary for C-suite decision making"""
 
-    max_exposure = liability_analysis["total_regulatory_exposure"]["maximum"]
+    # Pull every reported figure out of the analysis before formatting
+    regulatory_exposure = liability_analysis["total_regulatory_exposure"]
+    max_exposure = regulatory_exposure["maximum"]
+    risk_adjusted_cost = regulatory_exposure["risk_adjusted"]
+    coverage_gap = liability_analysis["insurance_protection"]["estimated_gap"]
     defensibility = liability_analysis["defensibility_score"]
     recommendation = liability_analysis["recommendation"]
 
@@ -316,8 +389,8 @@ def generate_executive_summary(liability_analysis: Dict,
 
     FINANCIAL EXPOSURE:
     • Maximum Regulatory Penalty: ${max_exposure:,.0f}
-    • Risk-Adjusted Expected Cost: ${liability_analysis['total_regulatory_exposure']['risk_adjusted']:,.0f}
-    • Insurance Coverage Gap: ${liability_analysis['insurance_protection']['estimated_gap']:,.0f}
+    • Risk-Adjusted Expected Cost: ${risk_adjusted_cost:,.0f}
+    • Insurance Coverage Gap: ${coverage_gap:,.0f}
 
     LEGAL DEFENSIBILITY: {defensibility:.0f}/100
     • Legal Review: {'✓ Complete' if decision.legal_review_completed else '✗ Required'}
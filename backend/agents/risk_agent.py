@@ -4,16 +4,22 @@ Risk Assessment Agent for AI Governance
 Evaluates AI systems for comprehensive governance risks across multiple dimensions
 """
 
-import json
+import bisect
 import logging
+import time
 from typing import Dict, Any, List, Optional
 from datetime import datetime
-import uuid
 
 from .base_agent import BaseGovernanceAgent
 
 logger = logging.getLogger(__name__)
 
+# Risk levels from least to most severe
+RISK_LEVELS = ('low', 'medium', 'high', 'critical')
+
+# Shared default for optional sequence fields that are only read
+_EMPTY = ()
+
 class RiskAssessmentAgent(BaseGovernanceAgent):
     """
     Evaluates AI systems for governance risks across multiple dimensions
@@ -44,6 +50,9 @@ class RiskAssessmentAgent(BaseGovernanceAgent):
             'low': 0.0
         }
 
+        # Scores at or above each cutoff move up one entry in RISK_LEVELS
+        self._risk_level_cutoffs = tuple(self.risk_thresholds[level] for level in RISK_LEVELS[1:])
+
     def assess_ai_system_risk(self, system_context: Dict[str, Any]) -> Dict[str, Any]:
         """
         Perform comprehensive risk assessment for an AI system
@@ -56,7 +65,7 @@ class RiskAssessmentAgent(BaseGovernanceAgent):
             Comprehensive risk assessment with scores, findings, and recommendations
         """
         try:
-            assessment_start = datetime.now()
+            assessment_start = time.perf_counter()
 
             # Validate input
             if not self._validate_governance_input(['system_id', 'system_name', 'system_type'], system_context):
@@ -89,7 +98,7 @@ class RiskAssessmentAgent(BaseGovernanceAgent):
             )
 
             # Calculate processing time
-            processing_time = (datetime.now() - assessment_start).total_seconds()
+            processing_time = time.perf_counter() - assessment_start
 
             # Create assessment result
             assessment_result = {
@@ -314,7 +323,7 @@ Focus on practical, implementable recommendations that address identified risks
             base_score += 1.0
 
         # Cross-border data transfer risk
-        regulatory_scope = system_context.get('regulatory_scope', [])
+        regulatory_scope = system_context.get('regulatory_scope', _EMPTY)
         if isinstance(regulatory_scope, list) and 'GDPR' in regulatory_scope:
             base_score += 1.0
 
@@ -357,7 +366,7 @@ Focus on practical, implementable recommendations that address identified risks
             base_score += 1.5
 
         # Regulatory requirements for explainability
-        regulatory_scope = system_context.get('regulatory_scope', [])
+        regulatory_scope = system_context.get('regulatory_scope', _EMPTY)
         if isinstance(regulatory_scope, list):
             if 'EU_AI_Act' in regulatory_scope:
                 base_score += 1.0
@@ -371,7 +380,7 @@ Focus on practical, implementable recommendations that address identified risks
         base_score = 2.0
 
         # Number of applicable regulations
-        regulatory_scope = system_context.get('regulatory_scope', [])
+        regulatory_scope = system_context.get('regulatory_scope', _EMPTY)
         if isinstance(regulatory_scope, list):
             base_score += len(regulatory_scope) * 0.5
 
@@ -434,21 +443,14 @@ Focus on practical, implementable recommendations that address identified risks
 
     def _determine_risk_level(self, overall_risk: float) -> str:
         """Determine categorical risk level from numeric score"""
-        if overall_risk >= self.risk_thresholds['critical']:
-            return 'critical'
-        elif overall_risk >= self.risk_thresholds['high']:
-            return 'high'
-        elif overall_risk >= self.risk_thresholds['medium']:
-            return 'medium'
-        else:
-            return 'low'
+        return RISK_LEVELS[bisect.bisect_right(self._risk_level_cutoffs, overall_risk)]
 
     def _assess_regulatory_compliance(self, system_context: Dict[str, Any],
                                     dimensional_scores: Dict[str, Any]) -> Dict[str, Any]:
         """Assess compliance against applicable regulatory frameworks"""
-        regulatory_scope = system_context.get('regulatory_scope', [])
+        regulatory_scope = system_context.get('regulatory_scope', _EMPTY)
         if not isinstance(regulatory_scope, list):
-            regulatory_scope = []
+            regulatory_scope = _EMPTY
 
         compliance_assessment = {}
 
@@ -504,7 +506,7 @@ Focus on practical, implementable recommendations that address identified risks
         # Regulatory compliance recommendations
         for framework, assessment in regulatory_assessment.items():
             if assessment.get('status') != 'compliant':
-                recommendations.extend(assessment.get('recommendations', []))
+                recommendations.extend(assessment.get('recommendations', _EMPTY))
 
         return recommendations[:10]  # Limit to top 10 recommendations
 
@@ -551,7 +553,7 @@ Focus on practical, implementable recommendations that address identified risks
         if data_sensitivity in ['personal_data', 'sensitive_personal']:
             factors.append(f'Processing of {data_sensitivity.replace("_", " ")}')
 
-        regulatory_scope = system_context.get('regulatory_scope', [])
+        regulatory_scope = system_context.get('regulatory_scope', _EMPTY)
         if isinstance(regulatory_scope, list) and 'GDPR' in regulatory_scope:
             factors.append('GDPR compliance requirements for data processing')
 
@@ -573,7 +575,7 @@ Focus on practical, implementable recommendations that address identified risks
         """Extract regulatory compliance risk factors"""
         factors = []
 
-        regulatory_scope = system_context.get('regulatory_scope', [])
+        regulatory_scope = system_context.get('regulatory_scope', _EMPTY)
         if isinstance(regulatory_scope, list):
             if len(regulatory_scope) > 3:
                 factors.append('Multiple overlapping regulatory requirements')
@@ -47,7 +47,7 @@ def analyze_liability():
                     'regulation': c.regulation,
                     'violation_type': c.violation_type,
                     'financial_penalty_range': f"${c.financial_penalty_min:,.0f} - ${c.financial_penalty_max:,.0f}",
-                    'criminal_liability_risk': c.criminal_liability_risk,
+                    'criminal_liability_risk': c.criminal_liability_risk.label,
                     'timeline_to_enforcement': c.timeline_to_enforcement,
                     'precedent_cases': c.precedent_cases
                 }
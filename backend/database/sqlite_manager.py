@@ -12,10 +12,24 @@ from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime, timedelta
 from cryptography.fernet import Fernet
 import os
-import uuid
+import secrets
+
+try:
+    import orjson
+except ImportError:  # Optional accelerator; stdlib json is used otherwise
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+def _serialize(data: Any) -> str:
+    """Serialize a document to JSON text, preferring orjson when installed"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            pass  # Fall through for values orjson refuses (e.g. oversized ints)
+    return json.dumps(data)
+
 class GovernanceDataManager:
     """
     Manages AI governance data using SQLite with encryption for sensitive information
@@ -462,7 +476,7 @@ class GovernanceDataManager:
     def _encrypt_sensitive_data(self, data: Dict) -> str:
         """Encrypt sensitive data"""
         try:
-            data_json = json.dumps(data)
+            data_json = _serialize(data)
             return self.cipher_suite.encrypt(data_json.encode()).decode()
         except Exception as e:
             logger.error(f"Failed to encrypt data: {str(e)}")
@@ -714,18 +728,18 @@ class GovernanceDataManager:
                     audit_data['assessment_id'], audit_data['system_id'],
                     audit_data.get('risk_assessment_id', ''),
                     audit_data['assessor_id'], audit_data.get('document_type', 'comprehensive_audit'),
-                    json.dumps(audit_data.get('executive_summary', {})),
-                    json.dumps(audit_data.get('detailed_findings', {})),
-                    json.dumps(audit_data.get('compliance_documentation', {})),
-                    json.dumps(audit_data.get('risk_documentation', {})),
-                    json.dumps(audit_data.get('audit_evidence', {})),
-                    json.dumps(audit_data.get('action_plan', {})),
-                    json.dumps(audit_data.get('audit_metadata', {})),
+                    _serialize(audit_data.get('executive_summary', {})),
+                    _serialize(audit_data.get('detailed_findings', {})),
+                    _serialize(audit_data.get('compliance_documentation', {})),
+                    _serialize(audit_data.get('risk_documentation', {})),
+                    _serialize(audit_data.get('audit_evidence', {})),
+                    _serialize(audit_data.get('action_plan', {})),
+                    _serialize(audit_data.get('audit_metadata', {})),
                     audit_data.get('next_audit_date', ''),
                     audit_data.get('document_retention_period', '7 years'),
                     audit_data.get('document_version', '1.0'),
                     audit_data.get('integrity_hash', ''),
-                    json.dumps(audit_data.get('access_controls', {})),
+                    _serialize(audit_data.get('access_controls', {})),
                     encrypted_data
                 ))
                 
@@ -736,44 +750,62 @@ class GovernanceDataManager:
             return False
     
     # Audit trail methods
+    _AUDIT_TRAIL_INSERT = '''
+        INSERT INTO audit_trails
+        (entry_id, system_id, assessment_id, event_type, timestamp, actor, action, 
+         details, before_state, after_state, ip_address, session_id,
+         data_hash, encrypted_data)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    '''
+
+    def _audit_event_row(self, system_id: str, action: str, details: str,
+                         actor: str = None, assessment_id: str = None,
+                         before_state: Dict = None, after_state: Dict = None,
+                         ip_address: str = None, session_id: str = None,
+                         timestamp: datetime = None) -> Tuple:
+        """Build the audit_trails insert parameters for one event"""
+        # Events written after the fact carry the time they happened; a single
+        # value keeps the entry ID, stored timestamp and integrity hash in agreement
+        now = timestamp or datetime.now()
+        entry_id = f"audit_{secrets.token_hex(4)}_{int(now.timestamp())}"
+
+        # Calculate data hash for integrity (stdlib json keeps the hashed
+        # bytes stable regardless of which serializer is installed)
+        hash_data = {
+            'system_id': system_id,
+            'action': action,
+            'details': details,
+            'timestamp': now.isoformat(),
+            'actor': actor
+        }
+        data_hash = hashlib.sha256(json.dumps(hash_data, sort_keys=True).encode()).hexdigest()
+        
+        # Encrypt sensitive audit data
+        sensitive_data = {
+            'before_state': before_state or {},
+            'after_state': after_state or {},
+            'session_details': {'ip_address': ip_address, 'session_id': session_id}
+        }
+        encrypted_data = self._encrypt_sensitive_data(sensitive_data)
+        
+        return (
+            entry_id, system_id, assessment_id, 'governance_action',
+            now.isoformat(), actor, action, details,
+            _serialize(before_state or {}), _serialize(after_state or {}),
+            ip_address, session_id, data_hash, encrypted_data
+        )
+
     def log_audit_event(self, system_id: str, action: str, details: str,
                        actor: str = None, assessment_id: str = None,
                        before_state: Dict = None, after_state: Dict = None,
-                       ip_address: str = None, session_id: str = None) -> bool:
+                       ip_address: str = None, session_id: str = None,
+                       timestamp: datetime = None) -> bool:
         """Log governance audit event"""
         try:
             with self._get_connection() as conn:
-                entry_id = f"audit_{uuid.uuid4().hex[:8]}_{int(datetime.now().timestamp())}"
-                
-                # Calculate data hash for integrity
-                hash_data = {
-                    'system_id': system_id,
-                    'action': action,
-                    'details': details,
-                    'timestamp': datetime.now().isoformat(),
-                    'actor': actor
-                }
-                data_hash = hashlib.sha256(json.dumps(hash_data, sort_keys=True).encode()).hexdigest()
-                
-                # Encrypt sensitive audit data
-                sensitive_data = {
-                    'before_state': before_state or {},
-                    'after_state': after_state or {},
-                    'session_details': {'ip_address': ip_address, 'session_id': session_id}
-                }
-                encrypted_data = self._encrypt_sensitive_data(sensitive_data)
-                
-                conn.execute('''
-                    INSERT INTO audit_trails
-                    (entry_id, system_id, assessment_id, event_type, actor, action, 
-                     details, before_state, after_state, ip_address, session_id,
-                     data_hash, encrypted_data)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    entry_id, system_id, assessment_id, 'governance_action',
-                    actor, action, details,
-                    json.dumps(before_state or {}), json.dumps(after_state or {}),
-                    ip_address, session_id, data_hash, encrypted_data
+                conn.execute(self._AUDIT_TRAIL_INSERT, self._audit_event_row(
+                    system_id, action, details, actor, assessment_id,
+                    before_state, after_state, ip_address, session_id, timestamp
                 ))
                 
                 conn.commit()
@@ -781,6 +813,27 @@ class GovernanceDataManager:
         except Exception as e:
             logger.error(f"Failed to log audit event: {str(e)}")
             return False
+
+    def log_audit_events_batch(self, events: List[Dict]) -> bool:
+        """Log several audit events in a single transaction
+
+        Each event is a dict of log_audit_event keyword arguments.
+        """
+        if not events:
+            return True
+
+        try:
+            with self._get_connection() as conn:
+                conn.executemany(
+                    self._AUDIT_TRAIL_INSERT,
+                    [self._audit_event_row(**event) for event in events]
+                )
+
+                conn.commit()
+                return True
+        except Exception as e:
+            logger.error(f"Failed to log audit event batch of {len(events)}: {str(e)}")
+            return False
     
     def get_system_audit_trail(self, system_id: str, limit: int = 100) -> List[Dict]:
         """Get audit trail for a specific system"""
@@ -887,8 +940,8 @@ class GovernanceDataManager:
         """Create governance assessment session"""
         try:
             with self._get_connection() as conn:
-                session_id = f"session_{uuid.uuid4().hex[:8]}"
-                session_token = f"token_{uuid.uuid4().hex}"
+                session_id = f"session_{secrets.token_hex(4)}"
+                session_token = f"token_{secrets.token_hex(16)}"
                 
                 conn.execute('''
                     INSERT INTO governance_sessions
@@ -0,0 +1,351 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the shared governance agent plumbing
+Rate limiting, response caching, JSON extraction, batched bias detection and
+the audit event queue, exercised with a fake Gemini model and a fake clock
+"""
+
+import os
+import sys
+import threading
+import unittest
+from datetime import datetime
+from unittest import mock
+
+# Add backend to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+os.environ.setdefault('GOOGLE_API_KEY', 'test-key')
+
+from google.api_core import exceptions as google_exceptions
+
+from agents import base_agent
+from agents.base_agent import (
+    AuditEventQueue,
+    BaseGovernanceAgent,
+    GeminiRateLimiter,
+    GeminiRateLimitExceeded,
+    GovernanceResponseCache,
+    GOVERNANCE_JSON_MARKER,
+)
+from agents.bias_agent import BiasDetectionAgent
+
+
+class FakeClock:
+    """Monotonic clock that only moves when the code under test sleeps"""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class FakeResponse:
+    def __init__(self, text: str):
+        self.text = text
+
+
+class FakeModel:
+    """Stands in for genai.GenerativeModel; reply is text, an exception or callable(prompt)"""
+
+    def __init__(self, reply):
+        self.reply = reply
+        self.prompts = []
+
+    def generate_content(self, prompt: str):
+        self.prompts.append(prompt)
+        reply = self.reply(prompt) if callable(self.reply) else self.reply
+        if isinstance(reply, Exception):
+            raise reply
+        return FakeResponse(reply)
+
+
+def make_limiter(rpm=1000, tpm=1000000, rpd=100000, max_wait=60.0):
+    clock = FakeClock()
+    limiter = GeminiRateLimiter(rpm=rpm, tpm=tpm, rpd=rpd, max_wait=max_wait,
+                                clock=clock, sleep=clock.sleep)
+    return limiter, clock
+
+
+class GeminiRateLimiterTests(unittest.TestCase):
+
+    def test_requests_per_minute_window(self):
+        limiter, clock = make_limiter(rpm=2)
+        limiter.acquire()
+        limiter.acquire()
+        limiter.acquire()
+        self.assertEqual(clock.sleeps, [60.0])
+
+    def test_tokens_per_minute_window(self):
+        limiter, clock = make_limiter(tpm=100)
+        limiter.acquire(60)
+        limiter.acquire(30)
+        self.assertEqual(clock.sleeps, [])
+        limiter.acquire(20)
+        self.assertEqual(clock.sleeps, [60.0])
+
+    def test_oversized_prompt_is_admitted_into_an_empty_window(self):
+        limiter, clock = make_limiter(tpm=100)
+        limiter.acquire(500)
+        self.assertEqual(clock.sleeps, [])
+
+    def test_requests_per_day_window(self):
+        limiter, clock = make_limiter(rpd=2, max_wait=86400)
+        limiter.acquire()
+        clock.now = 3600.0
+        limiter.acquire()
+        limiter.acquire()
+        self.assertEqual(clock.now, 86400.0)
+
+    def test_wait_beyond_max_wait_raises_without_sleeping(self):
+        limiter, clock = make_limiter(rpd=1, max_wait=60)
+        limiter.acquire()
+        with self.assertRaises(GeminiRateLimitExceeded):
+            limiter.acquire()
+        self.assertEqual(clock.sleeps, [])
+
+    def test_timeout_overrides_max_wait(self):
+        limiter, clock = make_limiter(rpm=1, max_wait=600)
+        limiter.acquire()
+        with self.assertRaises(GeminiRateLimitExceeded):
+            limiter.acquire(timeout=30)
+
+    def test_try_acquire_never_waits(self):
+        limiter, clock = make_limiter(rpm=1)
+        self.assertTrue(limiter.try_acquire())
+        self.assertFalse(limiter.try_acquire())
+        self.assertEqual(clock.sleeps, [])
+
+
+class GovernanceResponseCacheTests(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        patcher = mock.patch.object(base_agent.time, 'monotonic', self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_entries_expire_after_ttl(self):
+        cache = GovernanceResponseCache(maxsize=4, ttl_seconds=10)
+        cache.put('key', 'value')
+        self.clock.now = 10.0
+        self.assertEqual(cache.get('key'), 'value')
+        self.clock.now = 10.5
+        self.assertIsNone(cache.get('key'))
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = GovernanceResponseCache(maxsize=2, ttl_seconds=10)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.get('a')
+        cache.put('c', 3)
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('a'), 1)
+        self.assertEqual(cache.get('c'), 3)
+
+    def test_make_key_ignores_key_order_and_accepts_mixed_key_types(self):
+        make_key = GovernanceResponseCache.make_key
+        self.assertEqual(make_key({'a': 1, 'b': 2}), make_key({'b': 2, 'a': 1}))
+        self.assertEqual(make_key({1: 'a', 'b': 2}), make_key({'b': 2, 1: 'a'}))
+        self.assertNotEqual(make_key('prompt', {'a': 1}), make_key('prompt', {'a': 2}))
+
+
+class GovernanceAgentTestCase(unittest.TestCase):
+    """Runs each test against a generous private rate limiter and no real model"""
+
+    def setUp(self):
+        self.limiter, self.clock = make_limiter()
+        patcher = mock.patch.object(base_agent, '_rate_limiter', self.limiter)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def make_agent(self, agent_class, reply):
+        agent = agent_class(None, mock.MagicMock())
+        agent.model = FakeModel(reply)
+        return agent
+
+
+class CallModelTests(GovernanceAgentTestCase):
+
+    def test_quota_errors_past_max_wait_fall_back(self):
+        self.limiter.max_wait = 0.5
+        agent = self.make_agent(BaseGovernanceAgent, google_exceptions.ResourceExhausted('quota'))
+
+        with mock.patch.object(base_agent.time, 'sleep') as sleep:
+            with self.assertRaises(GeminiRateLimitExceeded):
+                agent._call_model('prompt')
+            response = agent._generate_governance_response('prompt')
+
+        sleep.assert_not_called()
+        self.assertEqual(response, agent._get_governance_fallback_response())
+
+    def test_exhausted_daily_quota_falls_back(self):
+        self.limiter.rpd = 1
+        agent = self.make_agent(BaseGovernanceAgent, 'first answer')
+
+        self.assertEqual(agent._generate_governance_response('one'), 'first answer')
+        self.assertEqual(agent._generate_governance_response('two'),
+                         agent._get_governance_fallback_response())
+        self.assertEqual(len(agent.model.prompts), 1)
+
+
+class ExtractGovernanceDataTests(GovernanceAgentTestCase):
+
+    NARRATIVE = "Risk: biased outcomes for older applicants\nWe recommend quarterly audits\n"
+
+    def setUp(self):
+        super().setUp()
+        self.agent = self.make_agent(BaseGovernanceAgent, '')
+
+    def test_fenced_json_block(self):
+        text = f'{self.NARRATIVE}{GOVERNANCE_JSON_MARKER}\n```json\n{{"risk_factors": ["x"]}}\n```\n'
+        self.assertEqual(self.agent._extract_governance_data(text, 'risk_assessment'),
+                         {'risk_factors': ['x']})
+
+    def test_missing_marker_uses_manual_parse(self):
+        self.assertEqual(
+            self.agent._extract_governance_data(self.NARRATIVE, 'risk_assessment'),
+            self.agent._manual_parse_governance_response(self.NARRATIVE, 'risk_assessment')
+        )
+
+    def test_non_object_payload_uses_manual_parse(self):
+        text = f'{self.NARRATIVE}{GOVERNANCE_JSON_MARKER}\n[1, 2, 3]\n'
+        structured = self.agent._extract_governance_data(text, 'risk_assessment')
+        self.assertEqual(structured,
+                         self.agent._manual_parse_governance_response(self.NARRATIVE, 'risk_assessment'))
+        self.assertTrue(structured['risk_factors'])
+
+    def test_batch_rejects_array_of_wrong_length(self):
+        text = f'Summary\n{GOVERNANCE_JSON_MARKER}\n[{{"analysis": "a"}}, {{"analysis": "b"}}]'
+        self.assertIsNone(self.agent._extract_governance_data_batch(text, 3))
+        self.assertEqual(len(self.agent._extract_governance_data_batch(text, 2)), 2)
+
+    def test_batch_rejects_non_object_records(self):
+        text = f'Summary\n{GOVERNANCE_JSON_MARKER}\n[{{"analysis": "a"}}, "b"]'
+        self.assertIsNone(self.agent._extract_governance_data_batch(text, 2))
+
+
+class DetectBiasBatchTests(GovernanceAgentTestCase):
+
+    SYSTEMS = [
+        {'system_id': f'sys-{number}', 'system_name': f'System {number}',
+         'system_type': 'classification', 'description': 'Loan approval model'}
+        for number in range(3)
+    ]
+
+    def test_malformed_batch_falls_back_to_per_system_requests(self):
+        def reply(prompt):
+            if 'BATCH BIAS DETECTION' in prompt:
+                return f'Summary\n{GOVERNANCE_JSON_MARKER}\n[{{"analysis": "only one"}}]'
+            return 'Risk: possible age bias\nWe recommend a fairness audit'
+
+        agent = self.make_agent(BiasDetectionAgent, reply)
+        results = agent.detect_bias_batch(self.SYSTEMS)
+
+        self.assertEqual(len(results), len(self.SYSTEMS))
+        self.assertEqual(len(agent.model.prompts), 1 + len(self.SYSTEMS))
+        self.assertTrue(all('BATCH BIAS DETECTION' not in prompt for prompt in agent.model.prompts[1:]))
+
+    def test_well_formed_batch_needs_one_request(self):
+        records = ', '.join(
+            f'{{"analysis": "analysis {number}", "risk_factors": []}}' for number in range(len(self.SYSTEMS))
+        )
+        agent = self.make_agent(BiasDetectionAgent, f'Summary\n{GOVERNANCE_JSON_MARKER}\n[{records}]')
+
+        results = agent.detect_bias_batch(self.SYSTEMS)
+
+        self.assertEqual(len(results), len(self.SYSTEMS))
+        self.assertEqual(len(agent.model.prompts), 1)
+
+    def test_unserializable_context_falls_back_to_per_system_requests(self):
+        systems = [dict(system, tags={'lending'}) for system in self.SYSTEMS]
+        agent = self.make_agent(BiasDetectionAgent, 'Risk: possible age bias')
+
+        results = agent.detect_bias_batch(systems)
+
+        self.assertEqual([result['system_id'] for result in results],
+                         [system['system_id'] for system in systems])
+        self.assertTrue(all('bias_severity' in result for result in results))
+
+    def test_mismatched_performance_data_is_rejected(self):
+        agent = self.make_agent(BiasDetectionAgent, 'Risk: possible age bias')
+
+        with self.assertRaises(ValueError):
+            agent.detect_bias_batch(self.SYSTEMS, [None])
+        self.assertEqual(agent.model.prompts, [])
+
+
+class RecordingDatabase:
+    """Governance database stand-in; block_writes holds the writer until released"""
+
+    def __init__(self, block_writes: bool = False):
+        self.events = []
+        self.writing = threading.Event()
+        self.release = threading.Event()
+        if not block_writes:
+            self.release.set()
+
+    def log_audit_events_batch(self, events):
+        self.writing.set()
+        self.release.wait(5)
+        self.events.extend(events)
+
+
+class AuditEventQueueTests(unittest.TestCase):
+
+    def test_flush_writes_pending_events(self):
+        audit_queue = AuditEventQueue(maxsize=100, batch_size=8)
+        governance_db = RecordingDatabase()
+
+        for number in range(20):
+            self.assertTrue(audit_queue.submit(governance_db, {'system_id': str(number)}))
+        audit_queue.flush()
+
+        self.assertEqual([event['system_id'] for event in governance_db.events],
+                         [str(number) for number in range(20)])
+
+    def test_events_carry_their_submission_time(self):
+        audit_queue = AuditEventQueue(maxsize=100, batch_size=8)
+        governance_db = RecordingDatabase(block_writes=True)
+
+        submitted_from = datetime.now()
+        audit_queue.submit(governance_db, {'system_id': 'late'})
+        submitted_until = datetime.now()
+        self.assertTrue(governance_db.writing.wait(5))
+        governance_db.release.set()
+        audit_queue.flush()
+
+        self.assertTrue(submitted_from <= governance_db.events[0]['timestamp'] <= submitted_until)
+
+    def test_full_queue_drops_and_counts_events(self):
+        audit_queue = AuditEventQueue(maxsize=2, batch_size=1)
+        governance_db = RecordingDatabase(block_writes=True)
+
+        # The worker takes the first event and blocks writing it
+        audit_queue.submit(governance_db, {'system_id': 'first'})
+        self.assertTrue(governance_db.writing.wait(5))
+
+        self.assertTrue(audit_queue.submit(governance_db, {'system_id': 'second'}))
+        self.assertTrue(audit_queue.submit(governance_db, {'system_id': 'third'}))
+        self.assertFalse(audit_queue.submit(governance_db, {'system_id': 'dropped'}))
+        self.assertEqual(audit_queue.dropped, 1)
+
+        # Flushing while the worker still holds the oldest event must not reorder the trail
+        flusher = threading.Thread(target=audit_queue.flush)
+        flusher.start()
+        flusher.join(0.1)
+        governance_db.release.set()
+        flusher.join(5)
+
+        self.assertFalse(flusher.is_alive())
+        self.assertEqual([event['system_id'] for event in governance_db.events],
+                         ['first', 'second', 'third'])
+
+
+if __name__ == '__main__':
+    unittest.main()